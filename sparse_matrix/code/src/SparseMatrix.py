@@ -1,13 +1,37 @@
 import os
 
+# Number of result lines buffered before each write when streaming to a file
+WRITE_CHUNK_LINES = 65536
+# Size in bytes of the buffer used for result files
+WRITE_BUFFER_SIZE = 1 << 20
+
+# Minimum number of buffered set_element updates before they are flushed
+PENDING_FLUSH_MIN = 4096
+
+# Number of parsed matrix files kept by load_matrix()
+MATRIX_CACHE_SIZE = 8
+_matrix_cache = {}  # (path, mtime, size) -> SparseMatrix, oldest first
+
 class SparseMatrix:
-    """A sparse matrix implementation using Coordinate List (COO) format."""
+    """A sparse matrix implementation using Coordinate List (COO) format.
+
+    Non-zero entries are stored as three parallel arrays (structure of arrays)
+    kept sorted in row-major order: rows_arr[i], cols_arr[i], vals_arr[i].
+    keys_arr[i] = rows_arr[i] * cols + cols_arr[i] is kept alongside them as a
+    single sorted integer key per entry for lookups and merges.
+    Inserts and deletions from set_element are buffered in a pending dict and
+    merged into the arrays in one pass (see _flush) before the arrays are used.
+    """
     
     def __init__(self, matrix_file_path=None, num_rows=0, num_cols=0):
         """Initialize matrix from file or with dimensions."""
         self.rows = num_rows
         self.cols = num_cols
-        self.elements = []  # List of tuples (row, col, value)
+        self.rows_arr = []  # Row index of each non-zero entry
+        self.cols_arr = []  # Column index of each non-zero entry
+        self.vals_arr = []  # Value of each non-zero entry
+        self.keys_arr = []  # Composed key (row * cols + col) of each entry
+        self._pending = {}  # Buffered updates: composed key -> new value (0 deletes)
         
         if matrix_file_path:
             self._load_matrix(matrix_file_path)
@@ -17,8 +41,9 @@ class SparseMatrix:
         Assumes 0-based indexing for rows and mixed 0-based/1-based for columns in the input file,
         where a column value equal to 'self.cols' is interpreted as 'self.cols - 1' (0-based)."""
         try:
+            # Read the whole file in one call and strip each line once
             with open(file_path, 'r') as f:
-                lines = [line.strip() for line in f if line.strip()]
+                lines = [line for line in map(str.strip, f.read().splitlines()) if line]
                 
             if len(lines) < 2:
                 raise ValueError("File must contain at least rows and cols definitions")
@@ -33,10 +58,11 @@ class SparseMatrix:
             if self.rows <= 0 or self.cols <= 0:
                 raise ValueError("Matrix dimensions must be positive integers")
             
-            # Parse elements
+            # Parse elements into parallel arrays
+            rows_arr, cols_arr, vals_arr = [], [], []
             for line in lines[2:]:
                 line = line.replace(" ", "")
-                if not (line.startswith("(") and line.endswith(")")):
+                if line[0] != "(" or line[-1] != ")":
                     raise ValueError(f"Invalid entry format: {line}")
                 
                 content = line[1:-1].split(',')
@@ -44,189 +70,448 @@ class SparseMatrix:
                     raise ValueError(f"Entry must have exactly 3 values: {line}")
                 
                 try:
-                    row = int(content[0])
-                    col = int(content[1])
-                    value = int(content[2])
+                    row, col, value = map(int, content)
                 except ValueError:
                     raise ValueError(f"All values must be integers: {line}")
                 
-                # Apply the CSR-like column adjustment first, based on its working logic.
-                # If col from file is self.cols (e.g., 3180 for a 3180-col matrix),
-                # it means the last column, which is 0-indexed self.cols - 1.
-                # Otherwise, it's assumed to be already 0-indexed.
-                adjusted_col = col - 1 if col == self.cols else col
-
-                # Now validate the adjusted_col against standard 0-based bounds
-                if not (0 <= row < self.rows and 0 <= adjusted_col < self.cols):
-                    raise ValueError(f"Index out of bounds after adjustment: ({row}, {col} (adjusted to {adjusted_col})) "
-                                     f"for matrix {self.rows}x{self.cols}. "
-                                     "Please ensure row indices are 0-based (0 to rows-1) "
-                                     "and column indices are consistent with the matrix dimensions, "
-                                     "with 'cols' value referring to the last column.")
-                
-                self.elements.append((row, adjusted_col, value))
+                rows_arr.append(row)
+                cols_arr.append(col)
+                vals_arr.append(value)
+            
+            # Apply the CSR-like column adjustment first, based on its working logic.
+            # If col from file is self.cols (e.g., 3180 for a 3180-col matrix),
+            # it means the last column, which is 0-indexed self.cols - 1.
+            # Otherwise, it's assumed to be already 0-indexed.
+            ncols = self.cols
+            adjusted_cols = [col - 1 if col == ncols else col for col in cols_arr]
             
-            # Sort elements by row then column for efficient operations
-            self.elements.sort(key=lambda x: (x[0], x[1]))
+            # Now validate all adjusted indices against standard 0-based bounds
+            # with min/max scans; only on failure look for the first bad entry
+            if rows_arr and (min(rows_arr) < 0 or max(rows_arr) >= self.rows
+                             or min(adjusted_cols) < 0 or max(adjusted_cols) >= ncols):
+                for row, col, adjusted_col in zip(rows_arr, cols_arr, adjusted_cols):
+                    if not (0 <= row < self.rows and 0 <= adjusted_col < ncols):
+                        raise ValueError(f"Index out of bounds after adjustment: ({row}, {col} (adjusted to {adjusted_col})) "
+                                         f"for matrix {self.rows}x{self.cols}. "
+                                         "Please ensure row indices are 0-based (0 to rows-1) "
+                                         "and column indices are consistent with the matrix dimensions, "
+                                         "with 'cols' value referring to the last column.")
+            cols_arr = adjusted_cols
+            
+            # Sort elements by row then column for efficient operations.
+            # The composed keys are plain ints, so the sort orders an index
+            # permutation by key lookup without calling back into Python.
+            keys = [r * self.cols + c for r, c in zip(rows_arr, cols_arr)]
+            order = sorted(range(len(keys)), key=keys.__getitem__)
+            keys = [keys[i] for i in order]
+            vals_arr = [vals_arr[i] for i in order]
+            
+            # Combine repeated (row, col) entries and drop explicit zeros so
+            # every key is unique, as the binary search and merges assume
+            if len(set(keys)) != len(keys) or 0 in vals_arr:
+                keys, vals_arr = _sum_duplicates(keys, vals_arr)
+            self._set_from_keys(keys, vals_arr)
             
         except FileNotFoundError:
             raise FileNotFoundError(f"File not found: {file_path}")
         except Exception as e:
             raise ValueError(f"Error loading matrix: {str(e)}")
 
+    def copy(self):
+        """Return an independent copy of this matrix."""
+        self._flush()
+        result = SparseMatrix(num_rows=self.rows, num_cols=self.cols)
+        result.rows_arr = self.rows_arr[:]
+        result.cols_arr = self.cols_arr[:]
+        result.vals_arr = self.vals_arr[:]
+        result.keys_arr = self.keys_arr[:]
+        return result
+
     def get_element(self, row, col):
         """Get element at (row, col). Returns 0 if not found."""
         if not (0 <= row < self.rows and 0 <= col < self.cols):
             raise ValueError("Indices out of bounds")
         
-        # Binary search for efficient lookup
-        left, right = 0, len(self.elements)
-        while left < right:
-            mid = (left + right) // 2
-            r, c, _ = self.elements[mid]
-            if r == row and c == col:
-                return self.elements[mid][2]
-            elif r < row or (r == row and c < col):
-                left = mid + 1
-            else:
-                right = mid
+        key = row * self.cols + col
+        if key in self._pending:
+            return self._pending[key]
+        idx = self._find(key)
+        if idx < len(self.keys_arr) and self.keys_arr[idx] == key:
+            return self.vals_arr[idx]
         return 0
 
     def set_element(self, row, col, value):
-        """Set element at (row, col). If value=0, remove the element."""
+        """Set element at (row, col). If value=0, remove the element.
+        Existing entries are updated in place and entries past the last one
+        are appended; other inserts and deletions are buffered and applied
+        together once the buffer outgrows max(PENDING_FLUSH_MIN, nnz / 8)."""
         if not (0 <= row < self.rows and 0 <= col < self.cols):
             raise ValueError("Indices out of bounds")
         
-        # Find position to insert/update
-        left, right = 0, len(self.elements)
+        # Find position to update
+        key = row * self.cols + col
+        idx = self._find(key)
+        if idx < len(self.keys_arr) and self.keys_arr[idx] == key:
+            if value == 0:
+                self._pending[key] = value
+            else:
+                self.vals_arr[idx] = value
+                self._pending.pop(key, None)
+        elif value != 0:
+            if idx == len(self.keys_arr):
+                # Appending keeps the arrays sorted, so no buffering is needed
+                self._pending.pop(key, None)
+                self.keys_arr.append(key)
+                self.vals_arr.append(value)
+                self.rows_arr.append(row)
+                self.cols_arr.append(col)
+                return
+            self._pending[key] = value
+        else:
+            self._pending.pop(key, None)
+        
+        if len(self._pending) > max(PENDING_FLUSH_MIN, len(self.keys_arr) >> 3):
+            self._flush()
+
+    def _flush(self):
+        """Splice the buffered set_element updates into the sorted arrays.
+        Each pending key is located by binary search; the untouched runs
+        between them are copied as slices, so only the updates themselves
+        cost Python-level work."""
+        if not self._pending:
+            return
+        ncols = self.cols
+        keys_arr, vals_arr = self.keys_arr, self.vals_arr
+        rows_arr, cols_arr = self.rows_arr, self.cols_arr
+        new_k, new_v, new_r, new_c = [], [], [], []
+        prev = 0
+        
+        for key in sorted(self._pending):
+            idx = self._find(key)
+            new_k.extend(keys_arr[prev:idx])
+            new_v.extend(vals_arr[prev:idx])
+            new_r.extend(rows_arr[prev:idx])
+            new_c.extend(cols_arr[prev:idx])
+            if idx < len(keys_arr) and keys_arr[idx] == key:
+                # Existing entries are only buffered for deletion
+                prev = idx + 1
+            else:
+                new_k.append(key)
+                new_v.append(self._pending[key])
+                new_r.append(key // ncols)
+                new_c.append(key % ncols)
+                prev = idx
+        
+        new_k.extend(keys_arr[prev:])
+        new_v.extend(vals_arr[prev:])
+        new_r.extend(rows_arr[prev:])
+        new_c.extend(cols_arr[prev:])
+        self.keys_arr, self.vals_arr = new_k, new_v
+        self.rows_arr, self.cols_arr = new_r, new_c
+        self._pending = {}
+
+    def _find(self, key):
+        """Binary search keys_arr for the first entry with a composed key >= key."""
+        keys_arr = self.keys_arr
+        left, right = 0, len(keys_arr)
         while left < right:
             mid = (left + right) // 2
-            r, c, _ = self.elements[mid]
-            if r == row and c == col:
-                if value == 0:
-                    del self.elements[mid]
-                else:
-                    self.elements[mid] = (row, col, value)
-                return
-            elif r < row or (r == row and c < col):
+            if keys_arr[mid] < key:
                 left = mid + 1
             else:
                 right = mid
-        
-        if value != 0:
-            self.elements.insert(left, (row, col, value))
+        return left
+
+    def _set_from_keys(self, keys, vals):
+        """Replace the entries with sorted composed keys and their values,
+        decoding the row and column arrays from the keys."""
+        ncols = self.cols
+        self.keys_arr = keys
+        self.vals_arr = vals
+        self.rows_arr = [k // ncols for k in keys]
+        self.cols_arr = [k % ncols for k in keys]
 
     def add(self, other):
         """Add two matrices."""
         if self.rows != other.rows or self.cols != other.cols:
             raise ValueError("Matrix dimensions must match for addition")
         
-        result = SparseMatrix(num_rows=self.rows, num_cols=self.cols)
-        i = j = 0
-        
-        while i < len(self.elements) and j < len(other.elements):
-            sr, sc, sv = self.elements[i]
-            or_, oc, ov = other.elements[j]
-            
-            if (sr, sc) < (or_, oc):
-                result.elements.append((sr, sc, sv))
-                i += 1
-            elif (sr, sc) > (or_, oc):
-                result.elements.append((or_, oc, ov))
-                j += 1
-            else:
-                sum_val = sv + ov
-                if sum_val != 0:
-                    result.elements.append((sr, sc, sum_val))
-                i += 1
-                j += 1
-        
-        # Add remaining elements
-        while i < len(self.elements):
-            result.elements.append(self.elements[i])
-            i += 1
-        while j < len(other.elements):
-            result.elements.append(other.elements[j])
-            j += 1
-            
-        return result
+        return self._merge(other, 1)
 
     def subtract(self, other):
         """Subtract two matrices."""
         if self.rows != other.rows or self.cols != other.cols:
             raise ValueError("Matrix dimensions must match for subtraction")
         
+        return self._merge(other, -1)
+
+    def _merge(self, other, sign):
+        """Merge two same-shaped matrices, computing self + sign * other.
+        Both operands are merged on their sorted composed keys, so the merge
+        compares single integers instead of (row, col) pairs."""
+        self._flush()
+        other._flush()
         result = SparseMatrix(num_rows=self.rows, num_cols=self.cols)
-        i = j = 0
+        v2 = other.vals_arr if sign > 0 else [-v for v in other.vals_arr]
+        out_k, out_v = _merge_keys(self.keys_arr, self.vals_arr, other.keys_arr, v2)
+        result._set_from_keys(out_k, out_v)
+        return result
+
+    def add_to_file(self, other, file_path):
+        """Add two matrices, writing the sum straight to file_path.
+        The result is streamed from the merge and never built as a matrix."""
+        if self.rows != other.rows or self.cols != other.cols:
+            raise ValueError("Matrix dimensions must match for addition")
         
-        while i < len(self.elements) and j < len(other.elements):
-            sr, sc, sv = self.elements[i]
-            or_, oc, ov = other.elements[j]
-            
-            if (sr, sc) < (or_, oc):
-                result.elements.append((sr, sc, sv))
-                i += 1
-            elif (sr, sc) > (or_, oc):
-                result.elements.append((or_, oc, -ov))
-                j += 1
-            else:
-                diff_val = sv - ov
-                if diff_val != 0:
-                    result.elements.append((sr, sc, diff_val))
-                i += 1
-                j += 1
+        self._merge_to_file(other, 1, file_path)
+
+    def subtract_to_file(self, other, file_path):
+        """Subtract two matrices, writing the difference straight to file_path.
+        The result is streamed from the merge and never built as a matrix."""
+        if self.rows != other.rows or self.cols != other.cols:
+            raise ValueError("Matrix dimensions must match for subtraction")
         
-        # Add remaining elements
-        while i < len(self.elements):
-            result.elements.append(self.elements[i])
-            i += 1
-        while j < len(other.elements):
-            result.elements.append((other.elements[j][0], other.elements[j][1], -other.elements[j][2]))
-            j += 1
-            
-        return result
+        self._merge_to_file(other, -1, file_path)
+
+    def _merge_to_file(self, other, sign, file_path):
+        """Write self + sign * other to file_path in the save_to_file format."""
+        self._flush()
+        other._flush()
+        try:
+            os.makedirs(os.path.dirname(file_path), exist_ok=True)
+            with open(file_path, 'w', buffering=WRITE_BUFFER_SIZE) as f:
+                f.write(f"rows={self.rows}\n")
+                f.write(f"cols={self.cols}\n")
+                _merge_write(self.keys_arr, self.vals_arr, other.keys_arr, other.vals_arr,
+                             sign, self.cols, f.write)
+        except Exception as e:
+            raise ValueError(f"Error saving to file: {str(e)}")
 
     def multiply(self, other):
         """Multiply two matrices."""
         if self.cols != other.rows:
             raise ValueError("Columns of first matrix must match rows of second matrix")
         
-        result = SparseMatrix(num_rows=self.rows, num_cols=other.cols)
-        
-        # Create a dictionary for quick access to other matrix's elements by row
-        other_dict = {}
-        for r, c, v in other.elements:
-            if r not in other_dict:
-                other_dict[r] = []
-            other_dict[r].append((c, v))
-        
-        # Multiply non-zero elements
-        temp = {}  # Temporary storage for result elements
-        
-        for sr, sc, sv in self.elements:
-            if sc in other_dict:
-                for oc, ov in other_dict[sc]:
-                    key = (sr, oc)
-                    temp[key] = temp.get(key, 0) + sv * ov
+        self._flush()
+        other._flush()
+        ncols = other.cols
+        result = SparseMatrix(num_rows=self.rows, num_cols=ncols)
         
-        # Convert temp dictionary to sorted elements list
-        result.elements = [(r, c, v) for (r, c), v in temp.items() if v != 0]
-        result.elements.sort(key=lambda x: (x[0], x[1]))
+        # Compressed Sparse Row (CSR) views of both matrices: the entries of
+        # row r live in cols_arr / vals_arr[indptr[r]:indptr[r + 1]]
+        keys, vals = _multiply_rows(self._row_pointers(), self.cols_arr, self.vals_arr,
+                                    other._row_pointers(), other.cols_arr, other.vals_arr,
+                                    ncols)
+        result._set_from_keys(keys, vals)
         
         return result
 
+    def _row_pointers(self):
+        """Build CSR row pointers: entries of row r are at indices
+        indptr[r] to indptr[r + 1] - 1 of the (row-sorted) arrays."""
+        indptr = [0] * (self.rows + 1)
+        for r in self.rows_arr:
+            indptr[r + 1] += 1
+        for r in range(self.rows):
+            indptr[r + 1] += indptr[r]
+        return indptr
+
     def save_to_file(self, file_path):
         """Save matrix to file in specified format."""
+        self._flush()
         try:
             os.makedirs(os.path.dirname(file_path), exist_ok=True)
-            with open(file_path, 'w') as f:
+            with open(file_path, 'w', buffering=WRITE_BUFFER_SIZE) as f:
                 f.write(f"rows={self.rows}\n")
                 f.write(f"cols={self.cols}\n")
-                for row, col, value in self.elements:
-                    f.write(f"({row}, {col}, {value})\n")
+                # Format whole chunks of entries and write each with one call
+                for start in range(0, len(self.vals_arr), WRITE_CHUNK_LINES):
+                    end = start + WRITE_CHUNK_LINES
+                    f.write("".join([f"({row}, {col}, {value})\n" for row, col, value
+                                     in zip(self.rows_arr[start:end], self.cols_arr[start:end],
+                                            self.vals_arr[start:end])]))
         except Exception as e:
             raise ValueError(f"Error saving to file: {str(e)}")
 
+def _sum_duplicates(keys, vals):
+    """Sum the values of equal adjacent keys in a sorted key/value stream and
+    drop zero results. Returns the reduced (keys, values) lists."""
+    out_k, out_v = [], []
+    last = None
+    for k, v in zip(keys, vals):
+        if k == last:
+            out_v[-1] += v
+        else:
+            out_k.append(k)
+            out_v.append(v)
+            last = k
+    
+    if 0 in out_v:
+        out_k = [k for k, v in zip(out_k, out_v) if v != 0]
+        out_v = [v for v in out_v if v != 0]
+    return out_k, out_v
+
+def _merge_keys(k1, v1, k2, v2):
+    """Merge two sorted key/value streams, summing values of equal keys and
+    dropping zero sums. Returns the merged (keys, values) lists.
+    Only the side that advanced reloads its key and checks its end, so each
+    step costs one bounds test instead of re-reading and testing both sides.
+    _merge_write repeats this loop; keep the two in sync."""
+    n1, n2 = len(k1), len(k2)
+    out_k, out_v = [], []
+    append_k, append_v = out_k.append, out_v.append
+    i = j = 0
+    
+    if n1 and n2:
+        a, b = k1[0], k2[0]
+        while True:
+            if a < b:
+                append_k(a)
+                append_v(v1[i])
+                i += 1
+                if i == n1:
+                    break
+                a = k1[i]
+            elif a > b:
+                append_k(b)
+                append_v(v2[j])
+                j += 1
+                if j == n2:
+                    break
+                b = k2[j]
+            else:
+                val = v1[i] + v2[j]
+                if val != 0:
+                    append_k(a)
+                    append_v(val)
+                i += 1
+                j += 1
+                if i == n1 or j == n2:
+                    break
+                a, b = k1[i], k2[j]
+    
+    # Add remaining elements
+    out_k.extend(k1[i:])
+    out_v.extend(v1[i:])
+    out_k.extend(k2[j:])
+    out_v.extend(v2[j:])
+    return out_k, out_v
+
+def _merge_write(k1, v1, k2, v2, sign, ncols, write):
+    """Same merge as _merge_keys, but computes k1/v1 + sign * k2/v2 and each
+    result entry is formatted as a "(row, col, value)" line and passed to
+    write in chunks of WRITE_CHUNK_LINES lines instead of being collected.
+    The merge loop is kept inline for speed: keep it in sync with _merge_keys.
+    Only the handling of the unmatched tails differs on purpose. Here they are
+    written in chunks; _merge_keys copies them with one slice extend."""
+    n1, n2 = len(k1), len(k2)
+    lines = []
+    append = lines.append
+    i = j = 0
+    
+    if n1 and n2:
+        a, b = k1[0], k2[0]
+        while True:
+            if a < b:
+                append(f"({a // ncols}, {a % ncols}, {v1[i]})\n")
+                i += 1
+                if i == n1:
+                    break
+                a = k1[i]
+            elif a > b:
+                append(f"({b // ncols}, {b % ncols}, {sign * v2[j]})\n")
+                j += 1
+                if j == n2:
+                    break
+                b = k2[j]
+            else:
+                val = v1[i] + sign * v2[j]
+                if val != 0:
+                    append(f"({a // ncols}, {a % ncols}, {val})\n")
+                i += 1
+                j += 1
+                if i == n1 or j == n2:
+                    break
+                a, b = k1[i], k2[j]
+            if len(lines) >= WRITE_CHUNK_LINES:
+                write("".join(lines))
+                lines.clear()
+    
+    write("".join(lines))
+    
+    # Add remaining elements, still formatting and writing one chunk at a time
+    for start in range(i, n1, WRITE_CHUNK_LINES):
+        end = start + WRITE_CHUNK_LINES
+        write("".join([f"({k // ncols}, {k % ncols}, {v})\n"
+                       for k, v in zip(k1[start:end], v1[start:end])]))
+    for start in range(j, n2, WRITE_CHUNK_LINES):
+        end = start + WRITE_CHUNK_LINES
+        write("".join([f"({k // ncols}, {k % ncols}, {sign * v})\n"
+                       for k, v in zip(k2[start:end], v2[start:end])]))
+
+def _multiply_rows(a_ptr, a_cols, a_vals, b_ptr, b_cols, b_vals, ncols):
+    """Row-by-row (Gustavson) product of two CSR matrices.
+    Each output row is accumulated in a dense array of length ncols that is
+    allocated once and reused. A column's first touch in a row overwrites the
+    stale value, so the accumulator never needs clearing, and only touched
+    columns are read back. Returns the sorted composed keys and values."""
+    acc = [0] * ncols       # Dense accumulator for the current output row
+    seen = [-1] * ncols     # Last output row that touched each column
+    touched = []            # Columns touched by the current output row
+    out_k, out_v = [], []
+    
+    for r in range(len(a_ptr) - 1):
+        lo, hi = a_ptr[r], a_ptr[r + 1]
+        if lo == hi:
+            continue
+        # Gather each referenced row of the right operand as a pair of
+        # slices, so the scatter loop iterates values instead of indexing
+        sources = 0  # Number of non-empty right-operand rows merged into this row
+        for sc, sv in zip(a_cols[lo:hi], a_vals[lo:hi]):
+            b_lo, b_hi = b_ptr[sc], b_ptr[sc + 1]
+            if b_lo == b_hi:
+                continue
+            sources += 1
+            for c, bv in zip(b_cols[b_lo:b_hi], b_vals[b_lo:b_hi]):
+                if seen[c] != r:
+                    seen[c] = r
+                    acc[c] = sv * bv
+                    touched.append(c)
+                else:
+                    acc[c] += sv * bv
+        
+        # Emit the row in column order, skipping entries that cancelled out.
+        # Columns from a single right-operand row are already in order.
+        if sources > 1:
+            touched.sort()
+        base = r * ncols
+        for c in touched:
+            v = acc[c]
+            if v != 0:
+                out_k.append(base + c)
+                out_v.append(v)
+        touched.clear()
+    return out_k, out_v
+
+def load_matrix(file_path):
+    """Load a matrix file, reusing the parsed matrix if the file is unchanged.
+    Entries are keyed on path, modification time and size and evicted least
+    recently used first; a changed file replaces its older entry. A copy is returned so callers cannot alter the cache."""
+    path = os.path.abspath(file_path)
+    stat = os.stat(path)
+    key = (path, stat.st_mtime, stat.st_size)
+    
+    matrix = _matrix_cache.pop(key, None)
+    if matrix is None:
+        matrix = SparseMatrix(path)
+        # Drop entries left over from earlier versions of the same file
+        for stale in [k for k in _matrix_cache if k[0] == path]:
+            del _matrix_cache[stale]
+        if len(_matrix_cache) >= MATRIX_CACHE_SIZE:
+            del _matrix_cache[next(iter(_matrix_cache))]
+    _matrix_cache[key] = matrix  # (Re)insert as most recently used
+    return matrix.copy()
+
 def get_user_input(prompt, validator=None):
     """Helper function to get validated user input."""
     while True:
@@ -299,22 +584,21 @@ def main():
             output_path = os.path.join(output_dir, output_name)
             
             # Load matrices
-            matrix1 = SparseMatrix(file1)
-            matrix2 = SparseMatrix(file2)
+            matrix1 = load_matrix(file1)
+            matrix2 = load_matrix(file2)
             
-            # Perform operation
+            # Perform operation and save result. Addition and subtraction
+            # stream the merged entries straight to the output file.
             if choice == '1':
-                result = matrix1.add(matrix2)
+                matrix1.add_to_file(matrix2, output_path)
                 op_name = "addition"
             elif choice == '2':
-                result = matrix1.subtract(matrix2)
+                matrix1.subtract_to_file(matrix2, output_path)
                 op_name = "subtraction"
             else: # choice == '3'
                 result = matrix1.multiply(matrix2)
                 op_name = "multiplication"
-            
-            # Save result
-            result.save_to_file(output_path)
+                result.save_to_file(output_path)
             print(f"\nMatrix {op_name} completed successfully!")
             print(f"Result saved to: {os.path.abspath(output_path)}")
             